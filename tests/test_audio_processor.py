@@ -0,0 +1,94 @@
+"""Unit tests for AudioProcessor helpers that need no network or ffmpeg."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tubechord import audio_processor
+from tubechord.audio_processor import AudioProcessor, _parse_video_id
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?list=PL123&v=dQw4w9WgXcQ&t=42",
+        "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    ],
+)
+def test_parse_video_id_supported_forms(url: str) -> None:
+    assert _parse_video_id(url) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch",
+        "https://youtu.be/../../etc",
+        "not a url",
+    ],
+)
+def test_parse_video_id_rejects_unknown(url: str) -> None:
+    assert _parse_video_id(url) is None
+
+
+def test_process_reuses_cached_chroma(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    processor = AudioProcessor(cache_dir=tmp_path)
+    signal = np.random.default_rng(0).standard_normal(processor.sample_rate).astype(np.float32)
+    calls: list[str] = []
+
+    def fake_stream(url: str) -> np.ndarray:
+        calls.append(url)
+        return signal
+
+    monkeypatch.setattr(processor, "stream_audio", fake_stream)
+    url = "https://youtu.be/dQw4w9WgXcQ"
+
+    first, first_hop = processor.process(url)
+    second, second_hop = processor.process(url)
+
+    assert len(calls) == 1
+    assert (tmp_path / "dQw4w9WgXcQ.npz").exists()
+    np.testing.assert_array_equal(first, second)
+    assert first_hop == second_hop
+
+
+def test_process_ignores_cache_with_other_settings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_stream(url: str) -> np.ndarray:
+        calls.append(url)
+        return np.zeros(22050, dtype=np.float32)
+
+    for hop_length in (256, 128):
+        processor = AudioProcessor(hop_length=hop_length, cache_dir=tmp_path)
+        monkeypatch.setattr(processor, "stream_audio", fake_stream)
+        processor.process("https://youtu.be/dQw4w9WgXcQ")
+
+    assert len(calls) == 2
+
+
+def test_process_ignores_cache_from_older_chroma_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_stream(url: str) -> np.ndarray:
+        calls.append(url)
+        return np.zeros(22050, dtype=np.float32)
+
+    processor = AudioProcessor(cache_dir=tmp_path)
+    monkeypatch.setattr(processor, "stream_audio", fake_stream)
+    processor.process("https://youtu.be/dQw4w9WgXcQ")
+
+    monkeypatch.setattr(audio_processor, "_CHROMA_CACHE_VERSION", 2)
+    processor.process("https://youtu.be/dQw4w9WgXcQ")
+
+    assert len(calls) == 2
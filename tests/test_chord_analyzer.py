@@ -0,0 +1,74 @@
+"""Unit tests for ChordAnalyzer on synthetic chromagrams."""
+
+import numpy as np
+import pytest
+from scipy.ndimage import uniform_filter1d
+
+from tubechord.chord_analyzer import ChordAnalyzer
+
+HOP = 0.1  # seconds per frame
+
+
+def _triad_frames(root: int, third: int, n_frames: int) -> np.ndarray:
+    chroma = np.full((12, n_frames), 0.05)
+    chroma[root % 12] = 1.0
+    chroma[(root + third) % 12] = 0.6
+    chroma[(root + 7) % 12] = 0.5
+    return chroma
+
+
+def test_analyze_empty_chroma_returns_no_events() -> None:
+    analyzer = ChordAnalyzer()
+    assert analyzer.analyze(np.zeros((12, 0)), HOP) == []
+
+
+def test_analyze_detects_major_then_minor() -> None:
+    chroma = np.hstack([_triad_frames(0, 4, 20), _triad_frames(9, 3, 20)])
+    events = ChordAnalyzer(smoothing_window=1).analyze(chroma, HOP)
+
+    assert [event.name for event in events] == ["C", "Am"]
+    assert events[0].start_time == 0.0
+    assert events[1].start_time == 20 * HOP
+    assert events[1].duration == 20 * HOP
+
+
+def test_analyze_minor_third_wraps_around_octave() -> None:
+    events = ChordAnalyzer(smoothing_window=1).analyze(_triad_frames(11, 3, 10), HOP)
+    assert [event.name for event in events] == ["Bm"]
+
+
+def test_analyze_discards_short_runs() -> None:
+    chroma = np.hstack([_triad_frames(0, 4, 20), _triad_frames(7, 4, 2), _triad_frames(0, 4, 20)])
+    events = ChordAnalyzer(min_chord_duration=0.5, smoothing_window=1).analyze(chroma, HOP)
+
+    assert [event.name for event in events] == ["C", "C"]
+    assert events[1].start_time == 22 * HOP
+
+
+@pytest.mark.parametrize("window", [1, 2, 8, 9])
+def test_smooth_chroma_matches_edge_padded_box_filter(window: int) -> None:
+    chroma = np.random.default_rng(window).random((12, 50))
+    smoothed = ChordAnalyzer(smoothing_window=window)._smooth_chroma(chroma)
+
+    assert smoothed.shape == chroma.shape
+    np.testing.assert_allclose(
+        smoothed, uniform_filter1d(chroma, size=window, axis=1, mode="nearest")
+    )
+
+
+def test_smooth_chroma_keeps_dtype() -> None:
+    chroma = np.ones((12, 20), dtype=np.float32)
+    smoothed = ChordAnalyzer()._smooth_chroma(chroma)
+    assert smoothed.dtype == np.float32
+    np.testing.assert_allclose(smoothed, 1.0)
+
+
+@pytest.mark.parametrize("window", [3, 4])
+def test_smooth_chroma_matches_sliding_window_mean(window: int) -> None:
+    chroma = np.random.default_rng(0).random((12, 30))
+    padded = np.pad(chroma, ((0, 0), (window // 2, window - 1 - window // 2)), mode="edge")
+    expected = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1).mean(axis=-1)
+
+    np.testing.assert_allclose(
+        ChordAnalyzer(smoothing_window=window)._smooth_chroma(chroma), expected
+    )
@@ -0,0 +1,15 @@
+"""Unit tests for CLI helpers."""
+
+from tubechord.cli import _title_to_filename
+
+
+def test_title_to_filename_strips_unsafe_characters() -> None:
+    assert _title_to_filename('AC/DC: "Back in Black"?') == "ACDC_Back_in_Black.mid"
+
+
+def test_title_to_filename_collapses_whitespace() -> None:
+    assert _title_to_filename("  Let  It\tBe  ") == "Let_It_Be.mid"
+
+
+def test_title_to_filename_keeps_unicode_word_characters() -> None:
+    assert _title_to_filename("Für Elise - Beethoven") == "Für_Elise_-_Beethoven.mid"
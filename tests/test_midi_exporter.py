@@ -0,0 +1,24 @@
+"""Unit tests for MidiExporter track layout."""
+
+from pathlib import Path
+
+import pytest
+
+from tubechord.chord_analyzer import ChordEvent
+from tubechord.midi_exporter import MidiExporter
+from tubechord.voicing_strategy import Grade1Voicer, Grade2Voicer, VoicingStrategy
+
+EVENTS = [ChordEvent(0, "major", 0.0, 1.5), ChordEvent(9, "minor", 1.5, 1.5)]
+
+
+@pytest.mark.parametrize(("voicer", "tracks"), [(Grade1Voicer(), 2), (Grade2Voicer(), 3)])
+def test_export_omits_empty_left_hand_track(
+    tmp_path: Path, voicer: VoicingStrategy, tracks: int
+) -> None:
+    output = tmp_path / "out.mid"
+    MidiExporter().export(voicer.voice_all(EVENTS), str(output))
+
+    data = output.read_bytes()
+    assert int.from_bytes(data[10:12], "big") == tracks
+    assert data.count(b"MTrk") == tracks
+    assert (b"Left Hand (Bass)" in data) == (tracks == 3)
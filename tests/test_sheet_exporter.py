@@ -1,8 +1,23 @@
-"""Unit tests for SheetExporter._build_html (no MIDI file or heavy deps needed)."""
+"""
+Tests for SheetExporter: HTML building and streaming, VexFlow duration and key
+lookup, the rendered-output disk cache, and MusicXML export (integration).
+"""
+
+import os
+import random
+import re
+import time
+from pathlib import Path
 
 import pytest
+from music21.pitch import Pitch
 
-from tubechord.sheet_exporter import SheetExporter
+from tubechord import sheet_exporter
+from tubechord.chord_analyzer import ChordEvent
+from tubechord.midi_exporter import MidiExporter
+from tubechord.sheet_exporter import _ACCIDENTAL_BY_MIDI, _KEY_BY_MIDI, SheetExporter
+from tubechord.sheet_renderers import VerovioHtmlRenderer
+from tubechord.voicing_strategy import Grade2Voicer
 
 
 def test_build_html_title_in_title_tag() -> None:
@@ -82,6 +97,82 @@ def test_build_html_is_valid_html_skeleton() -> None:
     assert "</body>" in html
 
 
+def test_iter_html_yields_svgs_unwrapped_and_matches_build_html() -> None:
+    renderer = VerovioHtmlRenderer()
+    svgs = ["<svg>p1</svg>", "<svg>p2</svg>"]
+    chunks = list(renderer.iter_html("Stream", svgs))
+    assert any(chunk is svgs[0] for chunk in chunks)
+    assert "".join(chunks) == renderer.build_html("Stream", svgs)
+
+
+def test_quarter_length_to_duration_matches_nearest_entry() -> None:
+    exporter = SheetExporter()
+    for step in range(1, 500):
+        quarter_length = step / 96  # covers the 16th grid plus triplet lengths
+        _, expected = min(exporter._DURATION_MAP, key=lambda pair: abs(pair[0] - quarter_length))
+        assert exporter._quarter_length_to_duration(quarter_length) == expected
+
+
+def test_key_table_matches_music21_midi_spelling() -> None:
+    for midi in range(128):
+        p = Pitch(midi=midi)
+        name = p.name.lower().replace("-", "b")
+        assert _KEY_BY_MIDI[midi] == f"{name}/{p.octave}"
+        assert _ACCIDENTAL_BY_MIDI[midi] == (name[1:] or None)
+
+
+def test_export_reuses_cached_render(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    midi_path = tmp_path / "song.mid"
+    midi_path.write_bytes(b"MThd fake")
+    renders: list[str] = []
+
+    def fake_render(self: SheetExporter, midi: str, output: str) -> None:
+        renders.append(output)
+        Path(output).write_text("<html>rendered</html>")
+
+    monkeypatch.setattr(SheetExporter, "_render_to_file", fake_render)
+    exporter = SheetExporter(title="Cached", cache_dir=tmp_path / "cache")
+    exporter.export(str(midi_path), str(tmp_path / "a.html"))
+    exporter.export(str(midi_path), str(tmp_path / "b.html"))
+
+    assert len(renders) == 1
+    assert (tmp_path / "b.html").read_text() == "<html>rendered</html>"
+
+    SheetExporter(title="Other", cache_dir=tmp_path / "cache").export(
+        str(midi_path), str(tmp_path / "c.html")
+    )
+    assert len(renders) == 2
+
+    # A renderer upgrade must not be served the previous render
+    monkeypatch.setattr(sheet_exporter, "_renderer_fingerprint", lambda: "verovio=next")
+    exporter.export(str(midi_path), str(tmp_path / "d.html"))
+    assert len(renders) == 3
+
+
+def test_prune_cache_evicts_stale_then_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = time.time()
+    ages = {"stale.html": 40 * 86400, "old.html": 300, "mid.html": 200, "new.html": 100}
+    for name, age in ages.items():
+        entry = tmp_path / name
+        entry.write_bytes(b"x" * 10)
+        os.utime(entry, (now - age, now - age))
+    monkeypatch.setattr(sheet_exporter, "_CACHE_MAX_BYTES", 20)
+
+    SheetExporter(cache_dir=tmp_path)._prune_cache()
+
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["mid.html", "new.html"]
+
+
+def test_renderer_fingerprint_covers_sheet_module_source() -> None:
+    sheet_exporter._renderer_fingerprint.cache_clear()
+    fingerprint = sheet_exporter._renderer_fingerprint()
+
+    assert "source=" in fingerprint
+    assert "missing" not in fingerprint
+
+
 def test_init_rejects_unsupported_output_format() -> None:
     with pytest.raises(ValueError, match="Unsupported output format"):
         SheetExporter(output_format="pdf")
@@ -96,17 +187,46 @@ def test_init_rejects_unsupported_output_format() -> None:
 @pytest.mark.integration
 def test_export_creates_html_file(tmp_path: pytest.TempPathFactory) -> None:
     """Smoke test: export() produces a non-empty HTML file."""
-    import os
-
-    mid_files = [f for f in os.listdir(".") if f.endswith(".mid")]
-    if not mid_files:
+    mid_file = next(Path(".").glob("*.mid"), None)
+    if mid_file is None:
         pytest.skip("No .mid file found in working directory for integration test.")
 
     out = tmp_path / "score.html"  # type: ignore[operator]
-    exporter = SheetExporter(title="Integration Test")
-    exporter.export(mid_files[0], str(out))
+    exporter = SheetExporter(title="Integration Test", use_cache=False)
+    exporter.export(str(mid_file), str(out))
 
     assert out.exists()
     content = out.read_text(encoding="utf-8")
     assert "<!DOCTYPE html>" in content
     assert "<svg" in content
+
+
+@pytest.mark.integration
+def test_musicxml_matches_stock_exporter(tmp_path: Path) -> None:
+    """MusicXML for a multi-bar Grade 2 score is what music21's own exporter writes."""
+    from music21 import converter
+    from music21.musicxml.m21ToXml import GeneralObjectExporter
+
+    # Chord lengths are whole analysis frames (512 samples at 11025 Hz), as
+    # ChordAnalyzer produces; this seed yields overlapping voices and tuplets
+    rng = random.Random(9)
+    events, start = [], 0.0
+    for _ in range(60):
+        duration = rng.randint(1, 90) * 512 / 11025
+        events.append(
+            ChordEvent(rng.randrange(12), rng.choice(["major", "minor"]), start, duration)
+        )
+        start += duration
+    midi_path = tmp_path / "song.mid"
+    MidiExporter().export(Grade2Voicer().voice_all(events), str(midi_path))
+
+    exporter = SheetExporter(use_cache=False)
+    score = exporter._parse_midi_score(str(midi_path))
+    exporter._remove_empty_parts(score)
+    ours = exporter._score_to_musicxml_bytes(score)
+    stock = GeneralObjectExporter(converter.parse(str(midi_path), forceSource=True)).parse()
+
+    def normalise(xml: bytes) -> bytes:
+        return re.sub(rb'id="[^"]*"|<encoding-date>[^<]*</encoding-date>', b"", xml)
+
+    assert normalise(ours) == normalise(stock)
@@ -1,7 +1,10 @@
 """Unit tests for renderers used by SheetExporter."""
 
+import json
+from dataclasses import asdict
+
 from tubechord.sheet_models import ScoreDocument, VexflowMeasure, VexflowNote
-from tubechord.sheet_renderers import VexflowMarkdownRenderer
+from tubechord.sheet_renderers import VexflowMarkdownRenderer, _score_to_json
 
 
 def _sample_document() -> ScoreDocument:
@@ -45,3 +48,23 @@ def test_vexflow_markdown_renderer_embeds_score_payload() -> None:
     assert '"time_signature":"4/4"' in content
     assert '"beat_value":4' in content
     assert '"keys":["c/4"]' in content
+
+
+def test_score_to_json_matches_json_dumps() -> None:
+    document = ScoreDocument(
+        title='Für "Elise" </script>',
+        time_signature="3/4",
+        beats=3,
+        beat_value=4,
+        measures=[
+            VexflowMeasure(
+                treble=[VexflowNote(keys=["c#/4", "eb/4"], duration="qd", accidentals=["#", "b"])],
+                bass=[],
+            ),
+            VexflowMeasure(
+                treble=[VexflowNote(keys=["b/4"], duration="hr", accidentals=[None])],
+                bass=[VexflowNote(keys=["d/3"], duration="hr", accidentals=[None])],
+            ),
+        ],
+    )
+    assert _score_to_json(document) == json.dumps(asdict(document), separators=(",", ":"))
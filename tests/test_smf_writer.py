@@ -0,0 +1,54 @@
+"""Unit tests for the Standard MIDI File writer."""
+
+import struct
+
+import pytest
+
+from tubechord.smf_writer import _vlq, encode_note_track, encode_smf, encode_tempo_track
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0, b"\x00"),
+        (0x7F, b"\x7f"),
+        (0x80, b"\x81\x00"),
+        (0x3FFF, b"\xff\x7f"),
+        (0x200000, b"\x81\x80\x80\x00"),
+    ],
+)
+def test_vlq_encoding(value: int, expected: bytes) -> None:
+    assert _vlq(value) == expected
+
+
+def test_tempo_track_holds_single_set_tempo() -> None:
+    # 80 BPM -> 750000 microseconds per quarter note
+    assert (
+        encode_tempo_track(80)
+        == b"MTrk\x00\x00\x00\x0b\x00\xff\x51\x03\x0b\x71\xb0\x00\xff\x2f\x00"
+    )
+
+
+def test_note_track_encodes_name_and_note_pair() -> None:
+    chunk = encode_note_track("RH", [(0, 60, 0.0, 1.0, 80)], ppq=960)
+    payload = (
+        b"\x00\xff\x03\x02RH"
+        + b"\x00\x90\x3c\x50"  # note on at tick 0
+        + b"\x87\x40\x80\x3c\x50"  # note off 960 ticks later
+        + b"\x00\xff\x2f\x00"
+    )
+    assert chunk == b"MTrk" + struct.pack(">I", len(payload)) + payload
+
+
+def test_note_track_releases_before_restriking_same_tick() -> None:
+    chunk = encode_note_track("", [(0, 60, 1.0, 1.0, 80), (0, 60, 0.0, 1.0, 80)], ppq=4)
+    events = chunk[8 + 4 : -4]  # strip chunk header, empty name and end of track
+    assert events == (
+        b"\x00\x90\x3c\x50" + b"\x04\x80\x3c\x50" + b"\x00\x90\x3c\x50" + b"\x04\x80\x3c\x50"
+    )
+
+
+def test_smf_header_counts_conductor_track() -> None:
+    data = encode_smf(80, [("RH", []), ("LH", [])])
+    assert data[:14] == b"MThd\x00\x00\x00\x06\x00\x01\x00\x03\x03\xc0"
+    assert data.count(b"MTrk") == 3
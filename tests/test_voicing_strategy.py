@@ -0,0 +1,55 @@
+"""Unit tests for the Grade 1 / Grade 2 voicing strategies."""
+
+from tubechord.chord_analyzer import ChordEvent
+from tubechord.voicing_strategy import Grade1Voicer, Grade2Voicer, VoicedChord, VoicingStrategy
+
+
+def _event(root: int, chord_type: str, start_time: float = 0.0) -> ChordEvent:
+    return ChordEvent(root=root, chord_type=chord_type, start_time=start_time, duration=1.0)
+
+
+def test_grade1_voices_right_hand_triad_only() -> None:
+    voiced = Grade1Voicer().voice(_event(9, "minor"))
+    assert voiced.right_hand_notes == [69, 72, 76]
+    assert voiced.left_hand_notes == []
+
+
+def test_grade2_adds_bass_root_an_octave_below() -> None:
+    voiced = Grade2Voicer().voice(_event(0, "major"))
+    assert voiced.right_hand_notes == [60, 64, 67]
+    assert voiced.left_hand_notes == [48]
+
+
+def test_voice_all_matches_voice_per_event() -> None:
+    voicer = Grade2Voicer()
+    events = [_event(0, "major", 0.0), _event(9, "minor", 1.0), _event(0, "major", 2.0)]
+
+    voiced = voicer.voice_all(events)
+
+    assert [vc.event for vc in voiced] == events
+    assert voiced == [voicer.voice(event) for event in events]
+
+
+def test_voice_all_returns_independent_note_lists() -> None:
+    voiced = Grade1Voicer().voice_all([_event(0, "major"), _event(0, "major", 1.0)])
+    voiced[0].right_hand_notes.append(99)
+    assert voiced[1].right_hand_notes == [60, 64, 67]
+
+
+class _CountingVoicer(VoicingStrategy):
+    """Voicing that depends on history, like a voice-leading strategy would."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def voice(self, event: ChordEvent) -> VoicedChord:
+        self.calls += 1
+        return VoicedChord(event=event, right_hand_notes=[60 + self.calls])
+
+
+def test_base_voice_all_voices_every_event() -> None:
+    voicer = _CountingVoicer()
+    voiced = voicer.voice_all([_event(0, "major"), _event(0, "major", 1.0)])
+
+    assert voicer.calls == 2
+    assert [vc.right_hand_notes for vc in voiced] == [[61], [62]]
@@ -1,18 +1,59 @@
 """AudioProcessor: Downloads audio from YouTube and extracts chroma features via librosa."""
 
 import os
+import re
 import shutil
+import subprocess
 import tempfile
+import zipfile
+from pathlib import Path
 from types import TracebackType
-from typing import Any
+from typing import Any, Final
+from urllib.parse import parse_qs, urlparse
 
 import librosa
 import numpy as np
 import numpy.typing as npt
 import yt_dlp
+from scipy.fft import rfft
+from scipy.signal.windows import hann
+
+from tubechord.cache import default_cache_dir
 
 FloatArray = npt.NDArray[np.floating[Any]]
 
+_VIDEO_ID_RE = re.compile(r"[\w-]{11}")
+_VIDEO_PATH_PREFIXES = ("/shorts/", "/embed/", "/live/", "/v/")
+
+# Bump whenever the chroma computation changes (window, resampler, tuning,
+# normalisation), so cached chromagrams from older code stop matching
+_CHROMA_CACHE_VERSION: Final = 1
+
+
+def _parse_video_id(url: str) -> str | None:
+    """
+    Extract the 11-character YouTube video id from a URL.
+
+    Handles ``youtube.com/watch?v=<id>``, ``youtu.be/<id>`` and the
+    ``/shorts/``, ``/embed/``, ``/live/`` and ``/v/`` path forms.
+
+    Returns:
+        The video id, or None if the URL is not a recognised YouTube video URL.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+
+    candidate = ""
+    if host == "youtu.be":
+        candidate = parsed.path.lstrip("/").split("/", maxsplit=1)[0]
+    elif host == "youtube.com" or host.endswith(".youtube.com"):
+        if parsed.path == "/watch":
+            candidate = parse_qs(parsed.query).get("v", [""])[0]
+        elif parsed.path.startswith(_VIDEO_PATH_PREFIXES):
+            candidate = parsed.path.split("/")[2]
+
+    return candidate if _VIDEO_ID_RE.fullmatch(candidate) else None
+
 
 class AudioProcessor:
     """
@@ -25,10 +66,46 @@ class AudioProcessor:
             chroma, hop_duration = processor.process(url)
     """
 
-    def __init__(self, hop_length: int = 512, n_fft: int = 2048) -> None:
+    # Chord roots live well below 5.5 kHz, so analysing at 11025 Hz loses
+    # nothing the chroma features use while halving the samples to process.
+    # n_fft/hop_length are halved with it to keep the same frequency
+    # resolution (~10.8 Hz per bin) and frame duration (~23 ms per hop).
+    DEFAULT_SAMPLE_RATE = 11025
+    RESAMPLE_TYPE = "soxr_lq"
+
+    # STFT frames processed per block; bounds the windowed-frame and spectrum
+    # buffers (~16 MB each at n_fft=1024) regardless of the audio length.
+    FFT_BLOCK_FRAMES = 4096
+
+    def __init__(
+        self,
+        hop_length: int = 256,
+        n_fft: int = 1024,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Args:
+            hop_length:  Samples between successive STFT frames.
+            n_fft:       STFT window size in samples.
+            sample_rate: Rate the audio is resampled to before analysis (Hz).
+            cache_dir:   Directory for cached chromagrams. Defaults to
+                         ``$XDG_CACHE_HOME/tubechord`` (``~/.cache/tubechord``).
+            use_cache:   Reuse chromagrams computed for the same video on a
+                         previous run, skipping download and decoding.
+        """
         self.hop_length = hop_length
         self.n_fft = n_fft
+        self.sample_rate = sample_rate
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.use_cache = use_cache
         self._temp_dirs: list[str] = []
+        # Pitch-class projection of the power spectrum, shape (12, 1 + n_fft // 2).
+        # Only depends on (sample_rate, n_fft), so it is built once per processor.
+        self._chroma_filter: FloatArray = librosa.filters.chroma(sr=sample_rate, n_fft=n_fft)
+        # Periodic Hann window, matching librosa.stft's default
+        self._window: FloatArray = hann(n_fft, sym=False).astype(np.float32)
 
     def get_video_title(self, url: str) -> str:
         """
@@ -91,15 +168,122 @@ class AudioProcessor:
 
         return wav_path
 
-    def extract_chroma(self, audio_path: str) -> tuple[FloatArray, float, float]:
+    def stream_audio(self, url: str) -> FloatArray:
         """
-        Load an audio file and compute its chroma STFT representation.
+        Decode the audio of a YouTube video straight into memory.
+
+        yt-dlp only resolves the direct media URL; ffmpeg then fetches it,
+        downmixes to mono, resamples to ``sample_rate`` and writes raw float32
+        PCM to a pipe. No intermediate WAV file is written or read back.
+
+        Args:
+            url: A valid YouTube video URL.
+
+        Returns:
+            Mono signal as a float32 array sampled at ``sample_rate``.
+
+        Raises:
+            FileNotFoundError: If ffmpeg is not installed.
+            RuntimeError: If yt-dlp returns no media URL or ffmpeg fails to decode it.
+            yt_dlp.utils.DownloadError: If yt-dlp cannot retrieve the video.
+        """
+        ydl_opts = {"format": "bestaudio/best", "quiet": True, "no_warnings": True}
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+
+        media_url = info.get("url") if isinstance(info, dict) else None
+        if not media_url:
+            raise RuntimeError(f"yt-dlp returned no direct media URL for '{url}'.")
+
+        headers = info.get("http_headers") or {}
+        command = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+        if headers:
+            command += ["-headers", "".join(f"{k}: {v}\r\n" for k, v in headers.items())]
+        command += [
+            "-i",
+            str(media_url),
+            "-vn",
+            "-f",
+            "f32le",
+            "-ac",
+            "1",
+            "-ar",
+            str(self.sample_rate),
+            "pipe:1",
+        ]
+
+        try:
+            result = subprocess.run(command, capture_output=True, check=False)
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(
+                "ffmpeg executable not found. Ensure ffmpeg is installed and accessible in your PATH."
+            ) from exc
+
+        if result.returncode != 0:
+            detail = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg could not decode the audio stream: {detail}")
+
+        return np.frombuffer(result.stdout, dtype=np.float32)
+
+    def _power_spectrogram(self, frames: FloatArray) -> FloatArray:
+        """
+        Compute the Hann-windowed power spectrum of each column of *frames*.
+
+        The FFTs run through scipy's pocketfft with one worker thread per CPU
+        core. Single-precision input stays single precision throughout.
+
+        Args:
+            frames: shape (n_fft, n_frames).
+
+        Returns:
+            Power spectrogram of shape (1 + n_fft // 2, n_frames).
+        """
+        spectrum = rfft(frames * self._window[:, np.newaxis], axis=0, workers=-1)
+        return spectrum.real**2 + spectrum.imag**2
+
+    def _chroma_stft(self, y: FloatArray) -> FloatArray:
+        """
+        Compute the normalised chromagram of a mono signal.
+
+        Equivalent to projecting ``np.abs(librosa.stft(y, ...)) ** 2`` onto the
+        chroma filter bank, but processed in blocks of ``FFT_BLOCK_FRAMES``
+        frames so only the compact (12, n_frames) result is ever held for the
+        whole signal — memory stays bounded for multi-hour streams.
+
+        Returns:
+            Chromagram of shape (12, n_frames), values in [0, 1].
+        """
+        padded = np.pad(y, self.n_fft // 2)
+        frames = librosa.util.frame(padded, frame_length=self.n_fft, hop_length=self.hop_length)
+        n_frames = frames.shape[1]
+
+        chroma = np.empty((self._chroma_filter.shape[0], n_frames), dtype=np.float32)
+        for start in range(0, n_frames, self.FFT_BLOCK_FRAMES):
+            stop = start + self.FFT_BLOCK_FRAMES
+            chroma[:, start:stop] = self._chroma_filter @ self._power_spectrogram(
+                frames[:, start:stop]
+            )
+
+        return librosa.util.normalize(chroma, norm=np.inf, axis=0)
+
+    def extract_chroma(self, audio_path: str | FloatArray) -> tuple[FloatArray, float, float]:
+        """
+        Compute the chroma STFT representation of an audio file or signal.
 
         Chroma STFT maps audio energy into 12 pitch classes (C, C#, D, ... B),
         collapsing octave information. This is the raw material for chord detection.
 
+        The audio is resampled to ``sample_rate`` with a fast, low-quality
+        resampler: chord-root detection is insensitive to the upper spectrum and
+        to the small artefacts this introduces. The chroma projection is a single
+        matrix product with a filter bank cached at construction; tuning
+        estimation is skipped, as the chord detector only needs the pitch class
+        with the most energy.
+
         Args:
-            audio_path: Path to a WAV (or any librosa-compatible) audio file.
+            audio_path: Path to a WAV (or any librosa-compatible) audio file, or
+                        a mono signal already sampled at ``sample_rate``
+                        (e.g. from :meth:`stream_audio`).
 
         Returns:
             A 3-tuple:
@@ -107,19 +291,26 @@ class AudioProcessor:
               - sample_rate (float): audio sample rate in Hz.
               - hop_duration (float): duration of each frame in seconds.
         """
-        y, sr = librosa.load(audio_path, mono=True)
-        chroma = librosa.feature.chroma_stft(
-            y=y,
-            sr=sr,
-            hop_length=self.hop_length,
-            n_fft=self.n_fft,
-        )
+        if isinstance(audio_path, str):
+            y, sr = librosa.load(
+                audio_path,
+                sr=self.sample_rate,
+                mono=True,
+                res_type=self.RESAMPLE_TYPE,
+            )
+        else:
+            y, sr = audio_path, self.sample_rate
+
+        chroma = self._chroma_stft(y)
         hop_duration = self.hop_length / sr
         return chroma, float(sr), hop_duration
 
     def process(self, url: str) -> tuple[FloatArray, float]:
         """
-        Full pipeline: download audio from YouTube and return its chromagram.
+        Full pipeline: stream audio from YouTube and return its chromagram.
+
+        When caching is enabled, the chromagram is stored per video id and
+        reused on later runs with the same STFT settings.
 
         Args:
             url: A valid YouTube video URL.
@@ -129,10 +320,63 @@ class AudioProcessor:
               - chroma (np.ndarray): shape (12, n_frames).
               - hop_duration (float): seconds per chroma frame.
         """
-        audio_path = self.download_audio(url)
-        chroma, _sr, hop_duration = self.extract_chroma(audio_path)
+        video_id = _parse_video_id(url) if self.use_cache else None
+        cache_path = self.cache_dir / f"{video_id}.npz" if video_id else None
+
+        if cache_path is not None:
+            cached = self._load_cached_chroma(cache_path)
+            if cached is not None:
+                return cached
+
+        signal = self.stream_audio(url)
+        chroma, _sr, hop_duration = self.extract_chroma(signal)
+
+        if cache_path is not None:
+            self._save_cached_chroma(cache_path, chroma, hop_duration)
         return chroma, hop_duration
 
+    def _load_cached_chroma(self, cache_path: Path) -> tuple[FloatArray, float] | None:
+        """
+        Load a cached chromagram if it was computed with the current settings.
+
+        Returns:
+            (chroma, hop_duration), or None on a cache miss, a settings or
+            cache-version mismatch, or an unreadable cache file.
+        """
+        try:
+            with np.load(cache_path) as cached:
+                if int(cached["version"]) != _CHROMA_CACHE_VERSION:
+                    return None
+                settings = (int(cached["hop_length"]), int(cached["n_fft"]))
+                if settings != (self.hop_length, self.n_fft):
+                    return None
+                if int(cached["sample_rate"]) != self.sample_rate:
+                    return None
+                return cached["chroma"], float(cached["hop_duration"])
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def _save_cached_chroma(
+        self, cache_path: Path, chroma: FloatArray, hop_duration: float
+    ) -> None:
+        """Write a chromagram to the cache; failures are ignored (cache is best-effort)."""
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                np.savez_compressed(
+                    fh,
+                    chroma=chroma,
+                    hop_duration=hop_duration,
+                    version=_CHROMA_CACHE_VERSION,
+                    hop_length=self.hop_length,
+                    n_fft=self.n_fft,
+                    sample_rate=self.sample_rate,
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     def cleanup(self) -> None:
         """Remove all temporary directories created during processing."""
         for temp_dir in self._temp_dirs:
@@ -0,0 +1,10 @@
+"""Per-user cache location shared by the extract and sheet pipelines."""
+
+import os
+from pathlib import Path
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (``$XDG_CACHE_HOME/tubechord``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "tubechord"
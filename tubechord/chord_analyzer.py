@@ -8,10 +8,17 @@ import numpy.typing as npt
 
 # Chromatic pitch class names (index 0 = C)
 NOTE_NAMES: list[str] = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+# Every chord name, indexed by root * 2 + is_minor: "C", "Cm", "C#", "C#m", ...
+_CHORD_NAMES: tuple[str, ...] = tuple(
+    f"{note}{suffix}" for note in NOTE_NAMES for suffix in ("", "m")
+)
+
 FloatArray = npt.NDArray[np.floating[Any]]
+IntArray = npt.NDArray[np.integer[Any]]
+BoolArray = npt.NDArray[np.bool_]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChordEvent:
     """
     A single detected chord occurrence in the audio timeline.
@@ -31,9 +38,7 @@ class ChordEvent:
     @property
     def name(self) -> str:
         """Human-readable chord name, e.g. 'Am' or 'G'."""
-        note = NOTE_NAMES[self.root]
-        suffix = "m" if self.chord_type == "minor" else ""
-        return f"{note}{suffix}"
+        return _CHORD_NAMES[self.root * 2 + (self.chord_type == "minor")]
 
 
 class ChordAnalyzer:
@@ -42,7 +47,7 @@ class ChordAnalyzer:
 
     Algorithm overview
     ------------------
-    For each chroma frame:
+    Every chroma frame is classified in a single vectorised pass:
 
     1. **Root detection** – The pitch class (0-11) with the highest energy is
        treated as the chord root.
@@ -58,13 +63,19 @@ class ChordAnalyzer:
        before step 1 and 2, producing more stable chord labels.
 
     4. **Grouping** – Consecutive frames with the same (root, type) are merged
-       into a single ChordEvent. Events shorter than *min_chord_duration* are
-       discarded as noise.
+       into a single ChordEvent by locating the frames where the label
+       changes. Events shorter than *min_chord_duration* are discarded as
+       noise.
     """
 
     MINOR_THIRD = 3  # semitones above root for minor 3rd
     MAJOR_THIRD = 4  # semitones above root for major 3rd
 
+    # Pitch class a minor/major 3rd above each root, indexed by root; a gather
+    # through these 12-entry tables replaces the per-frame modulo arithmetic.
+    _MINOR_THIRD_OF = ((np.arange(12) + MINOR_THIRD) % 12).astype(np.int8)
+    _MAJOR_THIRD_OF = ((np.arange(12) + MAJOR_THIRD) % 12).astype(np.int8)
+
     def __init__(
         self,
         min_chord_duration: float = 0.5,
@@ -89,39 +100,72 @@ class ChordAnalyzer:
         Apply a uniform (box) filter along the time axis of the chromagram.
 
         This averages each chroma bin over a sliding window of frames, which
-        reduces per-frame noise without requiring scipy as a direct dependency
-        (pure NumPy implementation).
+        reduces per-frame noise. Edges are padded by repeating the first/last
+        frame so the opening and closing chords are not attenuated.
+
+        Each window mean is the difference of two prefix sums, so the cost is
+        one cumulative-sum pass regardless of the window width. For even
+        widths the window extends one frame further into the past.
 
         Args:
             chroma: shape (12, n_frames).
 
         Returns:
-            Smoothed chromagram with the same shape.
+            Smoothed chromagram with the same shape and dtype.
         """
-        kernel = np.ones(self.smoothing_window) / self.smoothing_window
-        return np.apply_along_axis(
-            lambda row: np.convolve(row, kernel, mode="same"),
-            axis=1,
-            arr=chroma,
+        window = self.smoothing_window
+        # One extra leading frame so totals[:, i + window] - totals[:, i] is
+        # exactly the sum of the window ending at output frame i
+        padded = np.pad(
+            chroma,
+            ((0, 0), (window // 2 + 1, window - 1 - window // 2)),
+            mode="edge",
         )
+        # Accumulate in float64: float32 running totals drift over long songs
+        totals = padded.cumsum(axis=1, dtype=np.float64)
+        smoothed: FloatArray = (totals[:, window:] - totals[:, :-window]) / window
+        return smoothed.astype(chroma.dtype, copy=False)
 
-    def _detect_frame_chord(self, chroma_frame: FloatArray) -> tuple[int, str]:
+    def _classify_frames(self, chroma: FloatArray) -> tuple[IntArray, BoolArray]:
         """
-        Identify the (root, chord_type) for a single 12-element chroma vector.
+        Identify the (root, is_minor) pair for every chroma frame at once.
 
         Args:
-            chroma_frame: 1-D array of length 12 with energy per pitch class.
+            chroma: shape (12, n_frames) with energy per pitch class.
 
         Returns:
-            (root_pitch_class, "major" | "minor")
+            (roots, is_minor) — two 1-D arrays of length n_frames.
         """
-        root = int(np.argmax(chroma_frame))
+        # Roots fit in int8, which keeps the gathers below cache-friendly
+        roots = chroma.argmax(axis=0).astype(np.int8)
 
-        minor_third_energy = chroma_frame[(root + self.MINOR_THIRD) % 12]
-        major_third_energy = chroma_frame[(root + self.MAJOR_THIRD) % 12]
+        # Axis-aligned gathers: one row index per frame, no explicit frame index
+        minor_third_energy = np.take_along_axis(
+            chroma, self._MINOR_THIRD_OF[roots][np.newaxis, :], axis=0
+        )[0]
+        major_third_energy = np.take_along_axis(
+            chroma, self._MAJOR_THIRD_OF[roots][np.newaxis, :], axis=0
+        )[0]
 
-        chord_type = "minor" if minor_third_energy > major_third_energy else "major"
-        return root, chord_type
+        return roots, minor_third_energy > major_third_energy
+
+    def _find_runs(self, roots: IntArray, is_minor: BoolArray) -> tuple[IntArray, IntArray]:
+        """
+        Run-length encode the per-frame chord labels.
+
+        Args:
+            roots:    Root pitch class per frame.
+            is_minor: Minor flag per frame.
+
+        Returns:
+            (run_starts, run_lengths) — first frame index and frame count of
+            each run of identical (root, type) labels.
+        """
+        # Boolean mask of frames whose label differs from the previous frame —
+        # compared directly, with no integer differencing or dtype views
+        changed = (roots[1:] != roots[:-1]) | (is_minor[1:] != is_minor[:-1])
+        boundaries = np.concatenate(([0], np.flatnonzero(changed) + 1, [len(roots)]))
+        return boundaries[:-1], np.diff(boundaries)
 
     # ------------------------------------------------------------------
     # Public API
@@ -138,51 +182,31 @@ class ChordAnalyzer:
         Returns:
             List of ChordEvent objects ordered by start_time.
         """
-        smoothed = self._smooth_chroma(chroma)
-        n_frames = smoothed.shape[1]
-
+        n_frames = chroma.shape[1]
         if n_frames == 0:
             return []
 
-        # Detect chord for every frame
-        frame_chords: list[tuple[int, str]] = [
-            self._detect_frame_chord(smoothed[:, i]) for i in range(n_frames)
-        ]
-
-        # Merge consecutive identical chords into events
-        chord_events: list[ChordEvent] = []
-        current_root, current_type = frame_chords[0]
-        current_start_frame = 0
-
-        for i, (root, chord_type) in enumerate(frame_chords[1:], start=1):
-            if root == current_root and chord_type == current_type:
-                continue  # extend the current run
-
-            # Emit the accumulated run
-            run_duration = (i - current_start_frame) * hop_duration
-            if run_duration >= self.min_chord_duration:
-                chord_events.append(
-                    ChordEvent(
-                        root=current_root,
-                        chord_type=current_type,
-                        start_time=current_start_frame * hop_duration,
-                        duration=run_duration,
-                    )
-                )
-
-            current_root, current_type = root, chord_type
-            current_start_frame = i
-
-        # Emit the final run
-        run_duration = (n_frames - current_start_frame) * hop_duration
-        if run_duration >= self.min_chord_duration:
-            chord_events.append(
-                ChordEvent(
-                    root=current_root,
-                    chord_type=current_type,
-                    start_time=current_start_frame * hop_duration,
-                    duration=run_duration,
-                )
+        smoothed = self._smooth_chroma(chroma)
+        roots, is_minor = self._classify_frames(smoothed)
+        run_starts, run_lengths = self._find_runs(roots, is_minor)
+
+        # Discard runs that are too short before any Python objects are built
+        durations = run_lengths * hop_duration
+        kept = durations >= self.min_chord_duration
+        run_starts, durations = run_starts[kept], durations[kept]
+
+        return [
+            ChordEvent(
+                root=root,
+                chord_type="minor" if minor else "major",
+                start_time=start_time,
+                duration=duration,
             )
-
-        return chord_events
+            for root, minor, start_time, duration in zip(
+                roots[run_starts].tolist(),
+                is_minor[run_starts].tolist(),
+                (run_starts * hop_duration).tolist(),
+                durations.tolist(),
+                strict=True,
+            )
+        ]
@@ -1,22 +1,31 @@
 """TubeChord CLI entry point."""
 
+from __future__ import annotations
+
+import os
 import re
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from tubechord import __version__
-from tubechord.audio_processor import AudioProcessor
-from tubechord.chord_analyzer import ChordAnalyzer
-from tubechord.midi_exporter import MidiExporter
-from tubechord.voicing_strategy import Grade1Voicer, Grade2Voicer, VoicingStrategy
+
+# The analysis modules pull in numpy/scipy/librosa; they are imported inside the
+# commands that need them so `--help`, `--version` and `sheet` start quickly.
+if TYPE_CHECKING:
+    from tubechord.voicing_strategy import VoicingStrategy
 
 MAX_GRADE = 8
 
+_UNSAFE_CHARS_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def _get_voicer(grade: int) -> VoicingStrategy:
     """Return the appropriate VoicingStrategy for the requested grade."""
+    from tubechord.voicing_strategy import Grade1Voicer, Grade2Voicer
+
     if grade == 1:
         return Grade1Voicer()
     return Grade2Voicer()
@@ -28,8 +37,8 @@ def _title_to_filename(title: str) -> str:
     Strips characters that are invalid in filenames, collapses whitespace to
     underscores, and appends the .mid extension.
     """
-    sanitized = re.sub(r"[^\w\s-]", "", title)
-    sanitized = re.sub(r"\s+", "_", sanitized.strip())
+    sanitized = _UNSAFE_CHARS_RE.sub("", title)
+    sanitized = _WHITESPACE_RE.sub("_", sanitized.strip())
     return f"{sanitized}.mid"
 
 
@@ -83,7 +92,20 @@ def main() -> None:
         "Increase (e.g. 1.0) for noisy audio or complex harmonies."
     ),
 )
-def extract(url: str, grade: int, output: str | None, tempo: int, min_duration: float) -> None:
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Re-download and re-analyse the audio even if a cached chromagram exists.",
+)
+def extract(
+    url: str,
+    grade: int,
+    output: str | None,
+    tempo: int,
+    min_duration: float,
+    no_cache: bool,
+) -> None:
     """
     Extract piano chords from a YouTube video and save them as MIDI.
 
@@ -95,14 +117,21 @@ def extract(url: str, grade: int, output: str | None, tempo: int, min_duration:
       tubechord extract "https://youtu.be/dQw4w9WgXcQ" --grade 2 -o my_song.mid
       tubechord extract "https://youtu.be/dQw4w9WgXcQ" --grade 2 --tempo 60 --min-duration 1.0
     """
+    from tubechord.audio_processor import AudioProcessor
+    from tubechord.chord_analyzer import ChordAnalyzer
+    from tubechord.midi_exporter import MidiExporter
+
     voicer = _get_voicer(grade)
 
-    click.echo(f"tubechord v{__version__}")
-    click.echo(f"  URL    : {url}")
-    click.echo(f"  Grade  : {grade}  |  Tempo: {tempo} BPM")
-    click.echo()
+    header = [
+        f"tubechord v{__version__}",
+        f"  URL    : {url}",
+        f"  Grade  : {grade}  |  Tempo: {tempo} BPM",
+        "",
+    ]
+    click.echo("\n".join(header))
 
-    with AudioProcessor() as processor:
+    with AudioProcessor(use_cache=not no_cache) as processor:
         # ── Step 0: Resolve output filename ─────────────────────────────
         if output is None:
             click.echo("[0/4] Fetching video title...")
@@ -143,14 +172,20 @@ def extract(url: str, grade: int, output: str | None, tempo: int, min_duration:
             )
             sys.exit(1)
 
-        click.echo(f"      Detected {len(chord_events)} chord(s):")
+        # Build the listing first so it reaches stdout in a single write
+        lines = [f"      Detected {len(chord_events)} chord(s):"]
+        bars: dict[int, str] = {}  # duration bars repeat a lot; build each width once
         for event in chord_events:
-            bar = "=" * int(event.duration * 4)
-            click.echo(f"        {event.start_time:7.2f}s  {event.name:<4}  {bar}")
+            width = int(event.duration * 4)
+            bar = bars.get(width)
+            if bar is None:
+                bar = bars[width] = "=" * width
+            lines.append(f"        {event.start_time:7.2f}s  {event.name:<4}  {bar}")
+        click.echo("\n".join(lines))
 
         # ── Step 3: Apply voicing ───────────────────────────────────────
         click.echo(f"[3/4] Applying Grade {grade} voicing...")
-        voiced_chords = [voicer.voice(event) for event in chord_events]
+        voiced_chords = voicer.voice_all(chord_events)
 
         # ── Step 4: Export MIDI ─────────────────────────────────────────
         click.echo(f"[4/4] Writing MIDI file → '{output}'...")
@@ -191,11 +226,18 @@ def extract(url: str, grade: int, output: str | None, tempo: int, min_duration:
     show_default=True,
     help="Sheet output format: self-contained HTML (verovio) or Markdown with VexFlow script.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Render again even if identical output was cached by a previous run.",
+)
 def sheet(
     midi_file: str,
     output: str | None,
     title: str | None,
     output_format: str,
+    no_cache: bool,
 ) -> None:
     """
     Render a MIDI file as sheet music output (HTML or Markdown).
@@ -212,11 +254,11 @@ def sheet(
     """
     from tubechord.sheet_exporter import SheetExporter
 
-    midi_path = Path(midi_file)
-    resolved_title = title if title is not None else midi_path.stem.replace("_", " ")
+    base, _ = os.path.splitext(midi_file)
+    resolved_title = title if title is not None else os.path.basename(base).replace("_", " ")
     normalized_format = output_format.lower()
     default_suffix = ".html" if normalized_format == "html" else ".md"
-    resolved_output = output if output is not None else str(midi_path.with_suffix(default_suffix))
+    resolved_output = output if output is not None else base + default_suffix
 
     click.echo(f"tubechord v{__version__}")
     click.echo(f"  MIDI   : {midi_file}")
@@ -234,7 +276,9 @@ def sheet(
         click.echo("[2/3] Building VexFlow score payload...")
         click.echo("[3/3] Writing Markdown file...")
 
-    exporter = SheetExporter(title=resolved_title, output_format=normalized_format)
+    exporter = SheetExporter(
+        title=resolved_title, output_format=normalized_format, use_cache=not no_cache
+    )
     try:
         exporter.export(midi_file, resolved_output)
     except OSError as exc:
@@ -1,16 +1,8 @@
-"""MidiExporter: Converts VoicedChord events into a 2-track MIDI file."""
-
-from midiutil import MIDIFile
+"""MidiExporter: Converts VoicedChord events into a two-hand (RH/LH) MIDI file."""
 
+from tubechord.smf_writer import Note, encode_smf
 from tubechord.voicing_strategy import VoicedChord
 
-# In midiutil Format 1 MIDI, track 0 is the conductor/tempo track.
-# Note data written to track 0 is ignored by most players and notation apps.
-# Tracks 1 and 2 are the actual data tracks rendered as staves.
-TRACK_CONDUCTOR = 0  # Tempo/time signature only — never receives notes
-TRACK_RH = 1  # Right Hand / Chords — top staff    → treble clef
-TRACK_LH = 2  # Left Hand  / Bass   — bottom staff → bass clef
-
 # General MIDI channel assignments
 CHANNEL_RH = 0
 CHANNEL_LH = 1
@@ -18,10 +10,11 @@ CHANNEL_LH = 1
 
 class MidiExporter:
     """
-    Writes a two-track MIDI file from a list of VoicedChord events.
+    Writes a two-hand MIDI file (conductor + RH + LH tracks) from a list of
+    VoicedChord events.
 
-    Track layout (Format 1, 3 internal tracks)
-    ------------------------------------------
+    Track layout (Format 1, up to 3 internal tracks)
+    ------------------------------------------------
     Track 0 — conductor track (tempo/time signature only, no notes)
 
     Track 1 — "Right Hand (Chords)"  →  top staff / treble clef
@@ -30,8 +23,9 @@ class MidiExporter:
 
     Track 2 — "Left Hand (Bass)"  →  bottom staff / bass clef
         Contains the left-hand bass note(s) produced by the VoicingStrategy.
-        For Grade 1 this track is empty; for Grade 2 it holds the root note
-        one octave below the right-hand triad.
+        For Grade 2 it holds the root note one octave below the right-hand
+        triad. It is omitted entirely when no chord has left-hand notes
+        (Grade 1), so the file has no empty staff.
 
     This separation lets students mute one track in any standard MIDI player
     (GarageBand, MuseScore, etc.) to practise a single hand in isolation.
@@ -42,6 +36,8 @@ class MidiExporter:
     converted to beats using: beats = seconds × (tempo / 60).
     """
 
+    __slots__ = ("tempo", "velocity")
+
     DEFAULT_TEMPO = 80  # BPM — a comfortable practice tempo
     DEFAULT_VELOCITY = 80  # MIDI velocity for right-hand notes  (0-127)
     BASS_VELOCITY = 68  # Slightly softer left-hand bass notes
@@ -73,7 +69,7 @@ class MidiExporter:
 
     def export(self, voiced_chords: list[VoicedChord], output_path: str) -> None:
         """
-        Render voiced chords to a Standard MIDI File (SMF format 1, 2 tracks).
+        Render voiced chords to a Standard MIDI File (SMF format 1, 2-3 tracks).
 
         Args:
             voiced_chords: Ordered list of VoicedChord objects to write.
@@ -82,42 +78,31 @@ class MidiExporter:
         Raises:
             OSError: If the output file cannot be opened for writing.
         """
-        midi = MIDIFile(numTracks=3, removeDuplicates=False, deinterleave=False)
-
-        # --- Track 0: conductor (tempo only — no notes) ---
-        midi.addTempo(TRACK_CONDUCTOR, 0, self.tempo)
-
-        # --- Track 1: Right Hand (treble clef / top staff) ---
-        midi.addTrackName(TRACK_RH, 0, "Right Hand (Chords)")
-
-        # --- Track 2: Left Hand (bass clef / bottom staff) ---
-        midi.addTrackName(TRACK_LH, 0, "Left Hand (Bass)")
+        # Loop invariants hoisted out of the per-chord loop
+        beats_per_second = self.tempo / 60.0
+        rh_velocity = self.velocity
+        lh_velocity = self.BASS_VELOCITY
 
+        rh_notes: list[Note] = []
+        lh_notes: list[Note] = []
         for vc in voiced_chords:
-            start_beat = self._seconds_to_beats(vc.event.start_time)
-            duration_beats = self._seconds_to_beats(vc.event.duration)
+            start_beat = vc.event.start_time * beats_per_second
+            duration_beats = vc.event.duration * beats_per_second
 
             # Left-hand bass notes → Track 2
             for pitch in vc.left_hand_notes:
-                midi.addNote(
-                    track=TRACK_LH,
-                    channel=CHANNEL_LH,
-                    pitch=pitch,
-                    time=start_beat,
-                    duration=duration_beats,
-                    volume=self.BASS_VELOCITY,
-                )
+                lh_notes.append((CHANNEL_LH, pitch, start_beat, duration_beats, lh_velocity))
 
             # Right-hand triad notes → Track 1
             for pitch in vc.right_hand_notes:
-                midi.addNote(
-                    track=TRACK_RH,
-                    channel=CHANNEL_RH,
-                    pitch=pitch,
-                    time=start_beat,
-                    duration=duration_beats,
-                    volume=self.velocity,
-                )
-
+                rh_notes.append((CHANNEL_RH, pitch, start_beat, duration_beats, rh_velocity))
+
+        # encode_smf writes track 0 (conductor, tempo only) itself; note data
+        # there is ignored by most players, so the hands follow as tracks 1
+        # and 2 in list order (RH on the top staff, LH on the bottom)
+        tracks: list[tuple[str, list[Note]]] = [("Right Hand (Chords)", rh_notes)]
+        if lh_notes:  # Grade 1 has no bass line, so no empty bottom staff
+            tracks.append(("Left Hand (Bass)", lh_notes))
+        data = encode_smf(self.tempo, tracks)
         with open(output_path, "wb") as f:
-            midi.writeFile(f)
+            f.write(data)
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-import re
-from fractions import Fraction
+import hashlib
+import html
+import os
+import shutil
+import time
+from functools import cache
+from importlib import metadata
+from pathlib import Path
 from typing import Any, Final
 
+from tubechord import __version__
+from tubechord.cache import default_cache_dir
 from tubechord.sheet_models import ScoreDocument, VexflowMeasure, VexflowNote
 from tubechord.sheet_renderers import (
     SheetRenderer,
@@ -15,6 +23,50 @@ from tubechord.sheet_renderers import (
 
 SUPPORTED_FORMATS: Final[set[str]] = {"html", "md-vexflow"}
 
+# Modules whose source determines rendered output; hashed into the cache key
+# so any change to conversion, templates or renderer options misses the cache
+_RENDERER_MODULES: Final = ("sheet_exporter.py", "sheet_models.py", "sheet_renderers.py")
+
+# Rendered sheets are evicted once unused for this long, and least recently
+# used first whenever the cache directory outgrows the size cap
+_CACHE_MAX_AGE_SECONDS: Final = 30 * 24 * 60 * 60
+_CACHE_MAX_BYTES: Final = 100 * 1024 * 1024
+
+# VexFlow key names in the spelling music21 gives notes read from MIDI
+# (C#, E-, F#, G#, B-), indexed by MIDI note number
+_PITCH_CLASS_KEYS: Final = ("c", "c#", "d", "eb", "e", "f", "f#", "g", "g#", "a", "bb", "b")
+_KEY_BY_MIDI: Final[tuple[str, ...]] = tuple(
+    f"{_PITCH_CLASS_KEYS[midi % 12]}/{midi // 12 - 1}" for midi in range(128)
+)
+_ACCIDENTAL_BY_MIDI: Final[tuple[str | None, ...]] = tuple(
+    _PITCH_CLASS_KEYS[midi % 12][1:] or None for midi in range(128)
+)
+
+
+@cache
+def _renderer_fingerprint() -> str:
+    """
+    Identify everything besides the inputs that determines rendered output.
+
+    Covers the source of TubeChord's sheet modules plus the music21 and
+    verovio versions. Library versions are read from package metadata rather
+    than the modules themselves, so a cache hit never has to import either.
+    """
+    source = hashlib.blake2b(digest_size=16)
+    package_dir = Path(__file__).parent
+    for name in _RENDERER_MODULES:
+        try:
+            source.update((package_dir / name).read_bytes())
+        except OSError:
+            source.update(f"{name}=missing".encode())
+    versions = [f"tubechord={__version__}", f"source={source.hexdigest()}"]
+    for package in ("music21", "verovio"):
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=missing")
+    return ";".join(versions)
+
 
 class SheetExporter:
     """
@@ -23,8 +75,15 @@ class SheetExporter:
     Supported formats:
     - ``html``: MusicXML -> Verovio -> inline SVG in a self-contained HTML file.
     - ``md-vexflow``: markdown file with embedded VexFlow JavaScript renderer.
+
+    Rendered output is cached per MIDI content, title, format and renderer
+    fingerprint (source of the sheet modules plus music21 and verovio
+    versions), so re-exporting an unchanged file is a file copy. The cache is
+    capped by age and total size.
     """
 
+    __slots__ = ("title", "output_format", "renderer", "cache_dir", "use_cache")
+
     _DURATION_MAP: Final[list[tuple[float, str]]] = [
         (4.0, "w"),
         (3.0, "hd"),
@@ -35,9 +94,30 @@ class SheetExporter:
         (0.5, "8"),
         (0.25, "16"),
     ]
-
-    def __init__(self, title: str = "", output_format: str = "html") -> None:
+    # Exact lookup for the quantised lengths music21 produces, keyed in 16ths
+    _DURATION_BY_16THS: Final[dict[int, str]] = {
+        round(quarter_length * 16): duration for quarter_length, duration in _DURATION_MAP
+    }
+
+    def __init__(
+        self,
+        title: str = "",
+        output_format: str = "html",
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Args:
+            title:         Title shown in the output header.
+            output_format: One of ``SUPPORTED_FORMATS``.
+            cache_dir:     Directory for cached renders. Defaults to
+                           ``$XDG_CACHE_HOME/tubechord/sheets``.
+            use_cache:     Reuse output rendered from identical input on a
+                           previous run instead of rendering again.
+        """
         self.title = title
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir() / "sheets"
+        self.use_cache = use_cache
         normalized = output_format.strip().lower()
         if normalized not in SUPPORTED_FORMATS:
             supported = ", ".join(sorted(SUPPORTED_FORMATS))
@@ -59,17 +139,30 @@ class SheetExporter:
     def _parse_midi_score(self, midi_path: str) -> Any:
         from music21 import converter
 
-        return converter.parse(midi_path, format="midi")
+        # Each file is parsed once per run, so skip music21's pickle cache: on a
+        # cache miss it pickles the new stream to disk and immediately thaws it
+        # back, which costs about a third as much again as the parse itself.
+        return converter.parse(midi_path, format="midi", forceSource=True, storePickle=False)
 
     def _remove_empty_parts(self, score: Any) -> None:
-        """Remove parts that contain no notes/chords to avoid blank staves."""
+        """
+        Remove parts that contain no notes/chords to avoid blank staves.
+
+        TubeChord's own MIDI files never contain empty tracks; this guards
+        files produced by other tools.
+        """
         for part in list(score.parts):
-            if not part.flatten().notes:
+            # recurse() is lazy, so next() stops at the first note or chord
+            # instead of flattening the whole part into a new stream
+            if next(iter(part.recurse().notes), None) is None:
                 score.remove(part)
 
     def _score_to_musicxml_bytes(self, score: Any) -> bytes:
         from music21.musicxml.m21ToXml import GeneralObjectExporter
 
+        # parse() runs makeRests/makeNotation on a deep copy. Running them in
+        # place on the freshly parsed score changes the notation (voices,
+        # tuplets, page count), so the copy is load-bearing.
         exporter = GeneralObjectExporter(score)
         return exporter.parse()
 
@@ -114,12 +207,12 @@ class SheetExporter:
         return "4/4"
 
     def _parse_time_signature(self, time_signature: str) -> tuple[int, int]:
-        match = re.match(r"^(\d+)/(\d+)$", time_signature.strip())
-        if not match:
+        # isdecimal() accepts exactly the characters regex \d does, all of
+        # which int() can parse (unlike isdigit(), which also accepts "²")
+        numerator, sep, denominator = time_signature.strip().partition("/")
+        if not sep or not numerator.isdecimal() or not denominator.isdecimal():
             return 4, 4
-        beats = max(1, int(match.group(1)))
-        beat_value = max(1, int(match.group(2)))
-        return beats, beat_value
+        return max(1, int(numerator)), max(1, int(denominator))
 
     def _extract_measures(self, part: Any | None) -> list[Any]:
         if part is None:
@@ -131,35 +224,30 @@ class SheetExporter:
         if measure is None:
             return [self._default_rest(clef)]
 
+        # Bound once per measure rather than looked up again for every note
+        to_duration = self._quarter_length_to_duration
+        rest_key = "b/4" if clef == "treble" else "d/3"
+
         notes: list[VexflowNote] = []
         for element in measure.notesAndRests:
-            quarter_length = float(Fraction(element.duration.quarterLength))
-            duration = self._quarter_length_to_duration(quarter_length)
+            # quarterLength is a float, or a Fraction for tuplets; float()
+            # takes either directly, without an intermediate Fraction
+            duration = to_duration(float(element.duration.quarterLength))
 
             if element.isRest:
-                if clef == "treble":
-                    keys = ["b/4"]
-                else:
-                    keys = ["d/3"]
                 notes.append(
-                    VexflowNote(
-                        keys=keys,
-                        duration=f"{duration}r",
-                        accidentals=[None],
-                    )
+                    VexflowNote(keys=[rest_key], duration=f"{duration}r", accidentals=[None])
                 )
                 continue
 
-            if element.isChord:
-                keys = [self._pitch_to_key(pitch) for pitch in element.pitches]
-            else:
-                keys = [self._pitch_to_key(element.pitch)]
-
+            # Note.pitches is a one-element tuple, so chords and single notes
+            # share one path
+            midis = [pitch.midi for pitch in element.pitches]
             notes.append(
                 VexflowNote(
-                    keys=keys,
+                    keys=[_KEY_BY_MIDI[midi] for midi in midis],
                     duration=duration,
-                    accidentals=[self._extract_accidental(key) for key in keys],
+                    accidentals=[_ACCIDENTAL_BY_MIDI[midi] for midi in midis],
                 )
             )
 
@@ -174,41 +262,35 @@ class SheetExporter:
         if quarter_length <= 0:
             return "q"
 
+        # Within 1/32 of a table entry the nearest entry is that one, so the
+        # scan below is only needed for off-grid lengths such as tuplets
+        duration = self._DURATION_BY_16THS.get(round(quarter_length * 16))
+        if duration is not None:
+            return duration
+
         _, duration = min(
             self._DURATION_MAP,
             key=lambda pair: abs(pair[0] - quarter_length),
         )
         return duration
 
-    def _pitch_to_key(self, pitch: Any) -> str:
-        name = str(getattr(pitch, "name", "C")).lower().replace("-", "b")
-        octave_value = getattr(pitch, "octave", 4)
-        octave = octave_value if isinstance(octave_value, int) else 4
-        return f"{name}/{octave}"
-
-    def _extract_accidental(self, key: str) -> str | None:
-        pitch_name = key.split("/", maxsplit=1)[0]
-        if len(pitch_name) <= 1:
-            return None
-        accidental = pitch_name[1:]
-        if accidental in {"#", "b", "##", "bb", "n"}:
-            return accidental
-        return None
-
     # ------------------------------------------------------------------
     # Compatibility wrappers for existing tests/helpers
     # ------------------------------------------------------------------
 
+    def _html_renderer(self) -> VerovioHtmlRenderer:
+        if isinstance(self.renderer, VerovioHtmlRenderer):
+            return self.renderer
+        return VerovioHtmlRenderer()
+
     def _render_svgs(self, musicxml_bytes: bytes) -> list[str]:
-        html_renderer = VerovioHtmlRenderer()
-        return html_renderer.render_svgs(musicxml_bytes)
+        return self._html_renderer().render_svgs(musicxml_bytes)
 
     def _escape_html(self, text: str) -> str:
-        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        return html.escape(text, quote=False)
 
     def _build_html(self, svgs: list[str]) -> str:
-        html_renderer = VerovioHtmlRenderer()
-        return html_renderer.build_html(self.title, svgs)
+        return self._html_renderer().build_html(self.title, svgs)
 
     # ------------------------------------------------------------------
     # Public API
@@ -222,19 +304,110 @@ class SheetExporter:
             ValueError: If rendering fails or required data is missing.
             OSError: If the output file cannot be written.
         """
+        cache_path = self._cache_path(midi_path) if self.use_cache else None
+        if cache_path is not None and self._load_cached_output(cache_path, output_path):
+            return
+
+        self._render_to_file(midi_path, output_path)
+
+        if cache_path is not None:
+            self._save_cached_output(output_path, cache_path)
+
+    def _render_to_file(self, midi_path: str, output_path: str) -> None:
         score = self._parse_midi_score(midi_path)
         self._remove_empty_parts(score)
 
         if self.output_format == "html":
-            content = self.renderer.render(
+            chunks = self.renderer.render_stream(
                 title=self.title,
                 musicxml_bytes=self._score_to_musicxml_bytes(score),
             )
         else:
-            content = self.renderer.render(
+            chunks = self.renderer.render_stream(
                 title=self.title,
                 score_document=self._score_to_document(score),
             )
 
-        with open(output_path, "w", encoding="utf-8") as fh:
-            fh.write(content)
+        # Write each chunk as it is produced, so the document (e.g. pages of
+        # inline SVG) is never joined into one string in memory.
+        with open(output_path, "wb") as fh:
+            for chunk in chunks:
+                fh.write(chunk.encode("utf-8"))
+
+    # ------------------------------------------------------------------
+    # Output cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, midi_path: str) -> Path | None:
+        """
+        Return the cache entry for rendering ``midi_path`` with these settings.
+
+        Returns:
+            The cache file path, or None if the MIDI file cannot be read (the
+            render itself will then report the error).
+        """
+        try:
+            with open(midi_path, "rb") as fh:
+                midi_bytes = fh.read()
+        except OSError:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        for field in (_renderer_fingerprint(), self.output_format, self.title):
+            digest.update(field.encode("utf-8") + b"\0")
+        digest.update(midi_bytes)
+        return self.cache_dir / f"{digest.hexdigest()}{self.renderer.default_extension}"
+
+    def _load_cached_output(self, cache_path: Path, output_path: str) -> bool:
+        """Copy a cached render to ``output_path``; returns False on a cache miss."""
+        try:
+            shutil.copyfile(cache_path, output_path)
+        except OSError:
+            return False
+        try:
+            os.utime(cache_path)  # mark as recently used for _prune_cache
+        except OSError:
+            pass
+        return True
+
+    def _save_cached_output(self, output_path: str, cache_path: Path) -> None:
+        """Store a finished render in the cache; failures are ignored (cache is best-effort)."""
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """
+        Evict stale cache entries; failures are ignored (cache is best-effort).
+
+        Entries unused for ``_CACHE_MAX_AGE_SECONDS`` are removed, then the
+        least recently used ones until the directory fits ``_CACHE_MAX_BYTES``.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            for path in self.cache_dir.iterdir():
+                if path.suffix == ".tmp":
+                    continue  # another export is still writing it
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            return
+
+        oldest_allowed = time.time() - _CACHE_MAX_AGE_SECONDS
+        total = 0
+        for mtime, size, path in sorted(entries, reverse=True):
+            total += size
+            if mtime < oldest_allowed or total > _CACHE_MAX_BYTES:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
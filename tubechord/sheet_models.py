@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VexflowNote:
     """A single VexFlow note or chord token."""
 
@@ -12,7 +12,7 @@ class VexflowNote:
     accidentals: list[str | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VexflowMeasure:
     """A pair of grand-staff voices for one measure."""
 
@@ -20,7 +20,7 @@ class VexflowMeasure:
     bass: list[VexflowNote]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreDocument:
     """Neutral score representation consumed by non-Verovio renderers."""
 
@@ -2,226 +2,92 @@
 
 from __future__ import annotations
 
-import json
+import html
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import asdict
+from collections.abc import Iterable, Iterator
+from json.encoder import encode_basestring_ascii
+from string import Template
 from typing import Any, cast
 
-from tubechord.sheet_models import ScoreDocument
+from tubechord.sheet_models import ScoreDocument, VexflowNote
 
+# Each SVG is written between these wrappers rather than formatted into a
+# new string, so multi-MB pages are never copied just to add a div.
+_PAGE_PREFIX = '  <div class="page">'
+_PAGE_SUFFIX = "</div>\n"
+_HTML_EPILOGUE = "</body>\n</html>"
 
-def _escape_html(text: str) -> str:
-    """Escape the three characters that are unsafe in HTML text content."""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-
-class SheetRenderer(ABC):
-    """Abstract sheet renderer."""
-
-    @property
-    @abstractmethod
-    def default_extension(self) -> str:
-        """Default filename extension for this renderer."""
-
-    @abstractmethod
-    def render(
-        self,
-        *,
-        title: str,
-        musicxml_bytes: bytes | None = None,
-        score_document: ScoreDocument | None = None,
-    ) -> str:
-        """Render output into a file content string."""
-
-
-class VerovioHtmlRenderer(SheetRenderer):
-    """Render MusicXML bytes into a self-contained HTML document with inline SVG."""
-
-    # Verovio A4 layout constants (verovio abstract units; ~1 unit ≈ 0.1 mm)
-    _PAGE_HEIGHT: int = 2970  # A4 portrait height
-    _PAGE_WIDTH: int = 2100  # A4 portrait width
-    _SCALE: int = 40  # 40% — fits grand staff comfortably on A4
-    _PAGE_MARGIN: int = 100  # uniform margin on all four sides
-
-    @property
-    def default_extension(self) -> str:
-        return ".html"
-
-    def render(
-        self,
-        *,
-        title: str,
-        musicxml_bytes: bytes | None = None,
-        score_document: ScoreDocument | None = None,
-    ) -> str:
-        if musicxml_bytes is None:
-            raise ValueError("musicxml_bytes is required for HTML rendering.")
-
-        svgs = self.render_svgs(musicxml_bytes)
-        return self.build_html(title, svgs)
-
-    def render_svgs(self, musicxml_bytes: bytes) -> list[str]:
-        """
-        Render a MusicXML document to a list of SVG strings via verovio.
-
-        Raises:
-            ValueError: If verovio cannot load the MusicXML data.
-        """
-        import verovio
-
-        tk = verovio.toolkit()
-        tk.setOptions(
-            {
-                "pageHeight": self._PAGE_HEIGHT,
-                "pageWidth": self._PAGE_WIDTH,
-                "scale": self._SCALE,
-                "pageMarginTop": self._PAGE_MARGIN,
-                "pageMarginBottom": self._PAGE_MARGIN,
-                "pageMarginLeft": self._PAGE_MARGIN,
-                "pageMarginRight": self._PAGE_MARGIN,
-                "adjustPageHeight": True,
-                "font": "Leipzig",
-            }
-        )
-
-        loaded: bool = tk.loadData(musicxml_bytes.decode("utf-8"))
-        if not loaded:
-            raise ValueError("verovio could not load the MusicXML data.")
-
-        page_count: int = tk.getPageCount()
-        return [self._render_page_svg(tk, page_no) for page_no in range(1, page_count + 1)]
-
-    def _render_page_svg(self, toolkit: Any, page_no: int) -> str:
-        """
-        Render one page to SVG with compatibility for multiple verovio bindings.
-
-        Some versions accept keyword arguments, while others only accept
-        positional arguments.
-        """
-        try:
-            return cast(str, toolkit.renderToSVG(pageNo=page_no, xmlDeclaration=False))
-        except TypeError:
-            try:
-                return cast(str, toolkit.renderToSVG(page_no, False))
-            except TypeError:
-                return cast(str, toolkit.renderToSVG(page_no))
-
-    def build_html(self, title: str, svgs: list[str]) -> str:
-        """
-        Wrap a list of SVG strings in a self-contained HTML document.
-
-        Each SVG is placed in its own ``.page`` div. The stylesheet includes
-        both screen styles (white cards on a grey background) and print styles
-        (``page-break-after: always`` per page, no drop shadows).
-        """
-        title_safe = _escape_html(title)
-        heading = f"  <h1>{title_safe}</h1>\n" if title else ""
-        pages = "\n".join(f'  <div class="page">{svg}</div>' for svg in svgs)
-
-        return f"""<!DOCTYPE html>
+# HTML document head and stylesheet, parsed once at import. Substitutes
+# ``$title_safe`` (HTML-escaped title) and ``$heading`` (optional ``<h1>``).
+_HTML_PROLOGUE_TEMPLATE = Template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <title>{title_safe}</title>
+  <title>$title_safe</title>
   <style>
-    *, *::before, *::after {{ box-sizing: border-box; }}
-    body {{
+    *, *::before, *::after { box-sizing: border-box; }
+    body {
       font-family: Georgia, serif;
       background: #f0f0f0;
       margin: 0;
       padding: 2rem;
-    }}
-    h1 {{
+    }
+    h1 {
       text-align: center;
       font-size: 1.6rem;
       margin-bottom: 2rem;
       color: #222;
-    }}
-    .page {{
+    }
+    .page {
       background: #fff;
       box-shadow: 0 2px 8px rgba(0, 0, 0, 0.15);
       margin: 0 auto 3rem;
       max-width: 860px;
       padding: 1rem;
-    }}
-    .page svg {{
+    }
+    .page svg {
       display: block;
       width: 100%;
       height: auto;
-    }}
-    @media print {{
-      body {{
+    }
+    @media print {
+      body {
         background: #fff;
         padding: 0;
         margin: 0;
-      }}
-      h1 {{
+      }
+      h1 {
         margin-top: 1rem;
-      }}
-      .page {{
+      }
+      .page {
         box-shadow: none;
         page-break-after: always;
         max-width: 100%;
         padding: 0;
         margin: 0;
-      }}
-      .page:last-child {{
+      }
+      .page:last-child {
         page-break-after: avoid;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
-{heading}{pages}
-</body>
-</html>"""
-
-
-class VexflowMarkdownRenderer(SheetRenderer):
-    """Render a score document into Markdown with an embedded VexFlow script."""
-
-    @property
-    def default_extension(self) -> str:
-        return ".md"
-
-    def render(
-        self,
-        *,
-        title: str,
-        musicxml_bytes: bytes | None = None,
-        score_document: ScoreDocument | None = None,
-    ) -> str:
-        if score_document is None:
-            raise ValueError("score_document is required for md-vexflow rendering.")
-
-        title_safe = _escape_html(title)
-        score_json = json.dumps(asdict(score_document), separators=(",", ":"))
-        score_json = score_json.replace("</", "<\\/")
-
-        return f"""# {title_safe}
-
-This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer that allows script execution.
-
-<style>
-  #tubechord-score {{
-    display: grid;
-    gap: 1.25rem;
-    margin-top: 1rem;
-  }}
-  .tubechord-measure {{
-    border: 1px solid #d8d8d8;
-    border-radius: 8px;
-    background: #ffffff;
-    padding: 0.5rem;
-    overflow-x: auto;
-  }}
-</style>
-
-<div id="tubechord-score"></div>
-<script id="tubechord-score-data" type="application/json">{score_json}</script>
-<script type="module">
-  import {{
+$heading"""
+)
+
+# One verovio toolkit per thread, with the options last applied to it:
+# constructing a toolkit loads the SMuFL font tables, and a single toolkit
+# must not be shared between threads mid-render.
+_thread_toolkits = threading.local()
+
+# Client-side VexFlow renderer for the Markdown output. Kept readable here;
+# _VEXFLOW_SCRIPT_COMPACT (indentation and blank lines stripped) is what gets
+# embedded, which is safe because the script has no multi-line strings.
+_VEXFLOW_SCRIPT = """  import {
     Accidental,
     Formatter,
     Renderer,
@@ -229,45 +95,45 @@ This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer t
     StaveConnector,
     StaveNote,
     Voice
-  }} from "https://cdn.jsdelivr.net/npm/vexflow@4.2.3/build/esm/entry/vexflow.js";
+  } from "https://cdn.jsdelivr.net/npm/vexflow@4.2.3/build/esm/entry/vexflow.js";
 
   const host = document.getElementById("tubechord-score");
   const payloadNode = document.getElementById("tubechord-score-data");
 
-  if (!host || !payloadNode) {{
+  if (!host || !payloadNode) {
     throw new Error("Missing VexFlow score container.");
-  }}
+  }
 
-  const payload = JSON.parse(payloadNode.textContent || "{{}}");
+  const payload = JSON.parse(payloadNode.textContent || "{}");
   const beats = Number(payload.beats) || 4;
   const beatValue = Number(payload.beat_value) || 4;
   const timeSignature = payload.time_signature || "4/4";
 
-  const defaultTreble = [{{ keys: ["b/4"], duration: "wr", accidentals: [null] }}];
-  const defaultBass = [{{ keys: ["d/3"], duration: "wr", accidentals: [null] }}];
+  const defaultTreble = [{ keys: ["b/4"], duration: "wr", accidentals: [null] }];
+  const defaultBass = [{ keys: ["d/3"], duration: "wr", accidentals: [null] }];
   const measures = Array.isArray(payload.measures) && payload.measures.length > 0
     ? payload.measures
-    : [{{ treble: defaultTreble, bass: defaultBass }}];
+    : [{ treble: defaultTreble, bass: defaultBass }];
 
-  const toStaveNotes = (entries, clef) => entries.map((entry) => {{
-    const staveNote = new StaveNote({{
+  const toStaveNotes = (entries, clef) => entries.map((entry) => {
+    const staveNote = new StaveNote({
       clef,
       keys: Array.isArray(entry.keys) && entry.keys.length > 0 ? entry.keys : ["c/4"],
       duration: entry.duration || "q",
-    }});
+    });
 
-    if (Array.isArray(entry.accidentals)) {{
-      entry.accidentals.forEach((symbol, noteIndex) => {{
-        if (symbol) {{
+    if (Array.isArray(entry.accidentals)) {
+      entry.accidentals.forEach((symbol, noteIndex) => {
+        if (symbol) {
           staveNote.addModifier(new Accidental(symbol), noteIndex);
-        }}
-      }});
-    }}
+        }
+      });
+    }
 
     return staveNote;
-  }});
+  });
 
-  measures.forEach((measure, index) => {{
+  measures.forEach((measure, index) => {
     const measureRoot = document.createElement("div");
     measureRoot.className = "tubechord-measure";
     host.appendChild(measureRoot);
@@ -279,13 +145,13 @@ This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer t
     const trebleStave = new Stave(20, 24, 700);
     const bassStave = new Stave(20, 130, 700);
 
-    if (index === 0) {{
+    if (index === 0) {
       trebleStave.addClef("treble").addTimeSignature(timeSignature);
       bassStave.addClef("bass").addTimeSignature(timeSignature);
-    }} else {{
+    } else {
       trebleStave.addClef("treble");
       bassStave.addClef("bass");
-    }}
+    }
 
     trebleStave.setContext(context).draw();
     bassStave.setContext(context).draw();
@@ -305,8 +171,8 @@ This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer t
       ? measure.bass
       : defaultBass;
 
-    const trebleVoice = new Voice({{ num_beats: beats, beat_value: beatValue }});
-    const bassVoice = new Voice({{ num_beats: beats, beat_value: beatValue }});
+    const trebleVoice = new Voice({ num_beats: beats, beat_value: beatValue });
+    const bassVoice = new Voice({ num_beats: beats, beat_value: beatValue });
     trebleVoice.setMode(Voice.Mode.SOFT);
     bassVoice.setMode(Voice.Mode.SOFT);
 
@@ -320,6 +186,266 @@ This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer t
 
     trebleVoice.draw(context, trebleStave);
     bassVoice.draw(context, bassStave);
-  }});
+  });
+"""
+_VEXFLOW_SCRIPT_COMPACT = "\n".join(
+    line.strip() for line in _VEXFLOW_SCRIPT.splitlines() if line.strip()
+)
+
+# Markdown + VexFlow document shell, parsed once at import. Substitutes
+# ``$title_safe`` (HTML-escaped title), ``$score_json`` (score payload) and
+# ``$vexflow_script`` (the renderer script above).
+_MARKDOWN_TEMPLATE = Template(
+    """# $title_safe
+
+This Markdown uses embedded JavaScript + VexFlow. Open it in a Markdown viewer that allows script execution.
+
+<style>
+  #tubechord-score {
+    display: grid;
+    gap: 1.25rem;
+    margin-top: 1rem;
+  }
+  .tubechord-measure {
+    border: 1px solid #d8d8d8;
+    border-radius: 8px;
+    background: #ffffff;
+    padding: 0.5rem;
+    overflow-x: auto;
+  }
+</style>
+
+<div id="tubechord-score"></div>
+<script id="tubechord-score-data" type="application/json">$score_json</script>
+<script type="module">
+$vexflow_script
 </script>
 """
+)
+
+
+def _note_json(note: VexflowNote) -> str:
+    keys = ",".join(map(encode_basestring_ascii, note.keys))
+    accidentals = ",".join(
+        "null" if accidental is None else encode_basestring_ascii(accidental)
+        for accidental in note.accidentals
+    )
+    return (
+        f'{{"keys":[{keys}],"duration":{encode_basestring_ascii(note.duration)},'
+        f'"accidentals":[{accidentals}]}}'
+    )
+
+
+def _score_to_json(document: ScoreDocument) -> str:
+    """
+    Serialise a score document to compact JSON.
+
+    Produces the same text as ``json.dumps(dataclasses.asdict(document),
+    separators=(",", ":"))`` by writing the tokens straight from the
+    dataclass fields, without building an intermediate dict per note.
+    """
+    measures = ",".join(
+        f'{{"treble":[{",".join(map(_note_json, measure.treble))}],'
+        f'"bass":[{",".join(map(_note_json, measure.bass))}]}}'
+        for measure in document.measures
+    )
+    return (
+        f'{{"title":{encode_basestring_ascii(document.title)},'
+        f'"time_signature":{encode_basestring_ascii(document.time_signature)},'
+        f'"beats":{document.beats},"beat_value":{document.beat_value},'
+        f'"measures":[{measures}]}}'
+    )
+
+
+def _escape_html(text: str) -> str:
+    """Escape the three characters that are unsafe in HTML text content."""
+    return html.escape(text, quote=False)
+
+
+class SheetRenderer(ABC):
+    """Abstract sheet renderer."""
+
+    @property
+    @abstractmethod
+    def default_extension(self) -> str:
+        """Default filename extension for this renderer."""
+
+    def render(
+        self,
+        *,
+        title: str,
+        musicxml_bytes: bytes | None = None,
+        score_document: ScoreDocument | None = None,
+    ) -> str:
+        """Render output into a file content string."""
+        return "".join(
+            self.render_stream(
+                title=title, musicxml_bytes=musicxml_bytes, score_document=score_document
+            )
+        )
+
+    @abstractmethod
+    def render_stream(
+        self,
+        *,
+        title: str,
+        musicxml_bytes: bytes | None = None,
+        score_document: ScoreDocument | None = None,
+    ) -> Iterator[str]:
+        """
+        Render output as string chunks in file order.
+
+        Input validation and the expensive rendering happen before this
+        returns, so errors surface before a caller opens the output file.
+        """
+
+
+class VerovioHtmlRenderer(SheetRenderer):
+    """Render MusicXML bytes into a self-contained HTML document with inline SVG."""
+
+    # Verovio A4 layout constants (verovio abstract units; ~1 unit ≈ 0.1 mm)
+    _PAGE_HEIGHT: int = 2970  # A4 portrait height
+    _PAGE_WIDTH: int = 2100  # A4 portrait width
+    _SCALE: int = 40  # 40% — fits grand staff comfortably on A4
+    _PAGE_MARGIN: int = 100  # uniform margin on all four sides
+
+    @property
+    def default_extension(self) -> str:
+        return ".html"
+
+    def render_stream(
+        self,
+        *,
+        title: str,
+        musicxml_bytes: bytes | None = None,
+        score_document: ScoreDocument | None = None,
+    ) -> Iterator[str]:
+        if musicxml_bytes is None:
+            raise ValueError("musicxml_bytes is required for HTML rendering.")
+
+        svgs = self.render_svgs(musicxml_bytes)
+        return self.iter_html(title, svgs)
+
+    def render_svgs(self, musicxml_bytes: bytes) -> list[str]:
+        """
+        Render a MusicXML document to a list of SVG strings via verovio.
+
+        Raises:
+            ValueError: If verovio cannot load the MusicXML data.
+        """
+        tk = self._get_toolkit()
+
+        loaded: bool = tk.loadData(musicxml_bytes.decode("utf-8"))
+        if not loaded:
+            raise ValueError("verovio could not load the MusicXML data.")
+
+        page_count: int = tk.getPageCount()
+        return [self._render_page_svg(tk, page_no) for page_no in range(1, page_count + 1)]
+
+    def _toolkit_options(self) -> dict[str, Any]:
+        """Verovio layout options for this renderer."""
+        return {
+            "pageHeight": self._PAGE_HEIGHT,
+            "pageWidth": self._PAGE_WIDTH,
+            "scale": self._SCALE,
+            "pageMarginTop": self._PAGE_MARGIN,
+            "pageMarginBottom": self._PAGE_MARGIN,
+            "pageMarginLeft": self._PAGE_MARGIN,
+            "pageMarginRight": self._PAGE_MARGIN,
+            "adjustPageHeight": True,
+            "font": "Leipzig",
+        }
+
+    def _get_toolkit(self) -> Any:
+        """
+        Return this thread's verovio toolkit, configured for this renderer.
+
+        The toolkit is constructed on first use, and ``setOptions`` is only
+        called again when the requested options differ from the last ones set.
+        """
+        tk = getattr(_thread_toolkits, "toolkit", None)
+        if tk is None:
+            import verovio
+
+            tk = verovio.toolkit()
+            _thread_toolkits.toolkit = tk
+            _thread_toolkits.options = None
+
+        options = self._toolkit_options()
+        if options != _thread_toolkits.options:
+            tk.setOptions(options)
+            _thread_toolkits.options = options
+        return tk
+
+    def _render_page_svg(self, toolkit: Any, page_no: int) -> str:
+        """
+        Render one page to SVG with compatibility for multiple verovio bindings.
+
+        Some versions accept keyword arguments, while others only accept
+        positional arguments.
+        """
+        try:
+            return cast(str, toolkit.renderToSVG(pageNo=page_no, xmlDeclaration=False))
+        except TypeError:
+            try:
+                return cast(str, toolkit.renderToSVG(page_no, False))
+            except TypeError:
+                return cast(str, toolkit.renderToSVG(page_no))
+
+    def build_html(self, title: str, svgs: list[str]) -> str:
+        """
+        Wrap a list of SVG strings in a self-contained HTML document.
+
+        Each SVG is placed in its own ``.page`` div. The stylesheet includes
+        both screen styles (white cards on a grey background) and print styles
+        (``page-break-after: always`` per page, no drop shadows).
+        """
+        return "".join(self.iter_html(title, svgs))
+
+    def iter_html(self, title: str, svgs: Iterable[str]) -> Iterator[str]:
+        """
+        Yield the HTML document produced by :meth:`build_html` piece by piece.
+
+        Callers writing to a file can consume this directly so the SVG pages
+        are never concatenated into one string in memory.
+        """
+        yield self._html_prologue(title)
+        for svg in svgs:
+            yield _PAGE_PREFIX
+            yield svg
+            yield _PAGE_SUFFIX
+        yield _HTML_EPILOGUE
+
+    def _html_prologue(self, title: str) -> str:
+        """Return the document head, stylesheet and optional heading."""
+        title_safe = _escape_html(title)
+        heading = f"  <h1>{title_safe}</h1>\n" if title else ""
+        return _HTML_PROLOGUE_TEMPLATE.substitute(title_safe=title_safe, heading=heading)
+
+
+class VexflowMarkdownRenderer(SheetRenderer):
+    """Render a score document into Markdown with an embedded VexFlow script."""
+
+    @property
+    def default_extension(self) -> str:
+        return ".md"
+
+    def render_stream(
+        self,
+        *,
+        title: str,
+        musicxml_bytes: bytes | None = None,
+        score_document: ScoreDocument | None = None,
+    ) -> Iterator[str]:
+        if score_document is None:
+            raise ValueError("score_document is required for md-vexflow rendering.")
+
+        title_safe = _escape_html(title)
+        score_json = _score_to_json(score_document).replace("</", "<\\/")
+
+        document = _MARKDOWN_TEMPLATE.substitute(
+            title_safe=title_safe,
+            score_json=score_json,
+            vexflow_script=_VEXFLOW_SCRIPT_COMPACT,
+        )
+        return iter((document,))
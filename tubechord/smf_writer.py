@@ -0,0 +1,96 @@
+"""Minimal Standard MIDI File writer for TubeChord's note-only tracks.
+
+TubeChord only ever emits a tempo, track names and plain note-on/note-off
+pairs, so the file is encoded directly with ``struct`` instead of going
+through a general-purpose MIDI library.
+"""
+
+import struct
+from collections.abc import Iterable, Sequence
+from operator import itemgetter
+
+TICKS_PER_QUARTER = 960  # Pulses per quarter note (midiutil's default resolution)
+
+# (channel, pitch, start in beats, duration in beats, velocity)
+Note = tuple[int, int, float, float, int]
+
+_HEADER = struct.Struct(">4sIHHH")
+_CHUNK_HEADER = struct.Struct(">4sI")
+_CHANNEL_EVENT = struct.Struct(">BBB")
+_END_OF_TRACK = b"\x00\xff\x2f\x00"
+
+_META_TRACK_NAME = 0x03
+_META_SET_TEMPO = 0x51
+
+
+def _vlq(value: int) -> bytes:
+    """Encode a non-negative integer as a MIDI variable-length quantity."""
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray((value & 0x7F,))
+    value >>= 7
+    while value:
+        out.append(0x80 | (value & 0x7F))
+        value >>= 7
+    out.reverse()
+    return bytes(out)
+
+
+def _meta_event(meta_type: int, payload: bytes) -> bytes:
+    """Encode a meta event at delta time zero."""
+    return b"\x00\xff" + bytes((meta_type,)) + _vlq(len(payload)) + payload
+
+
+def _chunk(payload: bytes | bytearray) -> bytes:
+    return _CHUNK_HEADER.pack(b"MTrk", len(payload)) + payload
+
+
+def encode_tempo_track(tempo: float) -> bytes:
+    """Encode the conductor track holding a single Set Tempo event."""
+    microseconds_per_quarter = int(60_000_000 / tempo)
+    payload = _meta_event(_META_SET_TEMPO, microseconds_per_quarter.to_bytes(3, "big"))
+    return _chunk(payload + _END_OF_TRACK)
+
+
+def encode_note_track(name: str, notes: Iterable[Note], ppq: int = TICKS_PER_QUARTER) -> bytes:
+    """
+    Encode one named track of notes as an ``MTrk`` chunk.
+
+    Notes may be given in any order. Events are sorted by tick with note-offs
+    ahead of note-ons on the same tick, so a repeated pitch is released before
+    it is struck again; otherwise events keep their insertion order.
+    """
+    events: list[tuple[int, int, int, int, int]] = []
+    append = events.append
+    for channel, pitch, start, duration, velocity in notes:
+        on_tick = int(start * ppq)
+        off_tick = on_tick + int(duration * ppq)
+        append((on_tick, 1, 0x90 | channel, pitch, velocity))
+        append((off_tick, 0, 0x80 | channel, pitch, velocity))
+    events.sort(key=itemgetter(0, 1))
+
+    data = bytearray(_meta_event(_META_TRACK_NAME, name.encode("latin-1", "replace")))
+    pack = _CHANNEL_EVENT.pack
+    previous_tick = 0
+    for tick, _, status, pitch, velocity in events:
+        data += _vlq(tick - previous_tick)
+        data += pack(status, pitch, velocity)
+        previous_tick = tick
+    data += _END_OF_TRACK
+    return _chunk(data)
+
+
+def encode_smf(
+    tempo: float,
+    tracks: Sequence[tuple[str, Iterable[Note]]],
+    ppq: int = TICKS_PER_QUARTER,
+) -> bytes:
+    """
+    Encode a format 1 Standard MIDI File.
+
+    Track 0 is the conductor track carrying the tempo; each ``(name, notes)``
+    pair in ``tracks`` becomes one further track, in order.
+    """
+    chunks = [_HEADER.pack(b"MThd", 6, 1, len(tracks) + 1, ppq), encode_tempo_track(tempo)]
+    chunks.extend(encode_note_track(name, notes, ppq) for name, notes in tracks)
+    return b"".join(chunks)
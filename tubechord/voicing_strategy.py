@@ -34,7 +34,7 @@ class VoicedChord:
     Attributes:
         event:            The original ChordEvent (root, type, timing).
         right_hand_notes: MIDI note numbers for the right hand (treble, Track 1).
-        left_hand_notes:  MIDI note numbers for the left hand (bass, Track 0).
+        left_hand_notes:  MIDI note numbers for the left hand (bass, Track 2).
                           Empty list for Grade 1.
     """
 
@@ -46,10 +46,16 @@ class VoicedChord:
 # ── Interval tables ─────────────────────────────────────────────────────────
 
 #: Root position major triad: root, major-3rd (+4), perfect-5th (+7)
-MAJOR_INTERVALS: list[int] = [0, 4, 7]
+MAJOR_INTERVALS: tuple[int, ...] = (0, 4, 7)
 
 #: Root position minor triad: root, minor-3rd (+3), perfect-5th (+7)
-MINOR_INTERVALS: list[int] = [0, 3, 7]
+MINOR_INTERVALS: tuple[int, ...] = (0, 3, 7)
+
+# Chord type → intervals; new chord types (dim, aug, ...) only need an entry here
+_INTERVAL_TABLE: dict[str, tuple[int, ...]] = {
+    "major": MAJOR_INTERVALS,
+    "minor": MINOR_INTERVALS,
+}
 
 
 # ── Abstract base ────────────────────────────────────────────────────────────
@@ -63,9 +69,9 @@ class VoicingStrategy(ABC):
     layouts suitable for different piano difficulty levels.
     """
 
-    def _get_intervals(self, chord_type: str) -> list[int]:
-        """Return the semitone intervals for a major or minor triad."""
-        return MAJOR_INTERVALS if chord_type == "major" else MINOR_INTERVALS
+    def _get_intervals(self, chord_type: str) -> tuple[int, ...]:
+        """Return the semitone intervals for a triad, defaulting to minor."""
+        return _INTERVAL_TABLE.get(chord_type, MINOR_INTERVALS)
 
     @abstractmethod
     def voice(self, event: ChordEvent) -> VoicedChord:
@@ -79,6 +85,47 @@ class VoicingStrategy(ABC):
             VoicedChord with right_hand_notes and left_hand_notes populated.
         """
 
+    def voice_all(self, events: list[ChordEvent]) -> list[VoicedChord]:
+        """
+        Voice a whole sequence of chord events.
+
+        Calls ``voice()`` once per event, in order, so strategies whose voicing
+        depends on earlier chords (e.g. voice leading) work unchanged.
+        Strategies whose voicing depends only on the chord's (root,
+        chord_type) can override this to return ``_voice_all_by_chord()``.
+
+        Args:
+            events: Detected chord events, typically in timeline order.
+
+        Returns:
+            One VoicedChord per event, in the same order.
+        """
+        return [self.voice(event) for event in events]
+
+    def _voice_all_by_chord(self, events: list[ChordEvent]) -> list[VoicedChord]:
+        """
+        Voice events by running ``voice()`` once per distinct (root, chord_type).
+
+        Only valid for context-free strategies: every repeat of a chord reuses
+        the first voicing's note lists with its own timing, so at most 24
+        ``voice()`` calls are made however long the song is.
+        """
+        templates: dict[tuple[int, str], VoicedChord] = {}
+        voiced: list[VoicedChord] = []
+        for event in events:
+            key = (event.root, event.chord_type)
+            template = templates.get(key)
+            if template is None:
+                template = templates[key] = self.voice(event)
+            voiced.append(
+                VoicedChord(
+                    event=event,
+                    right_hand_notes=list(template.right_hand_notes),
+                    left_hand_notes=list(template.left_hand_notes),
+                )
+            )
+        return voiced
+
 
 # ── Concrete strategies ──────────────────────────────────────────────────────
 
@@ -114,6 +161,10 @@ class Grade1Voicer(VoicingStrategy):
             left_hand_notes=[],
         )
 
+    def voice_all(self, events: list[ChordEvent]) -> list[VoicedChord]:
+        # Voicing depends only on (root, chord_type), so repeats are reused
+        return self._voice_all_by_chord(events)
+
 
 class Grade2Voicer(VoicingStrategy):
     """
@@ -124,7 +175,7 @@ class Grade2Voicer(VoicingStrategy):
 
     MIDI note ranges
     ----------------
-    Left hand (Track 0, octave 3):
+    Left hand (Track 2, octave 3):
 
         C3 = MIDI 48  …  B3 = MIDI 59
 
@@ -152,3 +203,7 @@ class Grade2Voicer(VoicingStrategy):
             right_hand_notes=right_hand,
             left_hand_notes=left_hand,
         )
+
+    def voice_all(self, events: list[ChordEvent]) -> list[VoicedChord]:
+        # Voicing depends only on (root, chord_type), so repeats are reused
+        return self._voice_all_by_chord(events)
@@ -0,0 +1,13 @@
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+def rfft(
+    x: npt.ArrayLike,
+    n: int | None = ...,
+    axis: int = ...,
+    norm: str | None = ...,
+    overwrite_x: bool = ...,
+    workers: int | None = ...,
+) -> npt.NDArray[np.complexfloating[Any, Any]]: ...
@@ -0,0 +1,6 @@
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+def hann(M: int, sym: bool = ...) -> npt.NDArray[np.floating[Any]]: ...